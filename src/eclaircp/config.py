@@ -2,9 +2,10 @@
 EclairCP configuration management module.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TextIO
 from datetime import datetime
 from enum import Enum
+from io import StringIO
 from pydantic import BaseModel, Field, field_validator, field_serializer
 from .exceptions import ConfigurationError, create_configuration_error
 
@@ -139,7 +140,6 @@ class ConfigManager:
         Raises:
             ConfigurationError: If file cannot be loaded or is invalid
         """
-        import yaml
         import os
         
         if not os.path.exists(path):
@@ -150,27 +150,61 @@ class ConfigManager:
         
         try:
             with open(path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
-        except yaml.YAMLError as e:
+                return self.read_config(file, config_path=path)
+        except IOError as e:
             raise create_configuration_error(
-                f"Invalid YAML in configuration file: {e}",
+                f"Cannot read configuration file: {e}",
                 config_path=path,
                 original_error=e
             ) from e
-        except IOError as e:
+
+    def read_config(
+        self, stream: TextIO, config_path: Optional[str] = None
+    ) -> ConfigFile:
+        """Parse and validate configuration from an open text stream.
+        
+        Args:
+            stream: Text stream containing the YAML configuration
+            config_path: Path to the configuration file (for error context)
+            
+        Returns:
+            ConfigFile: Validated configuration object
+            
+        Raises:
+            ConfigurationError: If the stream content is empty or invalid
+        """
+        import yaml
+        
+        try:
+            config_data = yaml.safe_load(stream)
+        except yaml.YAMLError as e:
             raise create_configuration_error(
-                f"Cannot read configuration file: {e}",
-                config_path=path,
+                f"Invalid YAML in configuration file: {e}",
+                config_path=config_path,
                 original_error=e
             ) from e
         
         if config_data is None:
             raise create_configuration_error(
                 "Configuration file is empty",
-                config_path=path
+                config_path=config_path
             )
         
-        return self.validate_config(config_data, config_path=path)
+        return self.validate_config(config_data, config_path=config_path)
+
+    def load_from_string(self, text: str) -> ConfigFile:
+        """Parse and validate configuration from a YAML string.
+        
+        Args:
+            text: YAML configuration document
+            
+        Returns:
+            ConfigFile: Validated configuration object
+            
+        Raises:
+            ConfigurationError: If the content is empty or invalid
+        """
+        return self.read_config(StringIO(text))
 
     def save_config(self, config: ConfigFile, path: str) -> None:
         """Save configuration file with Pydantic serialization.
@@ -182,16 +216,14 @@ class ConfigManager:
         Raises:
             ConfigurationError: If file cannot be saved
         """
-        import yaml
         import os
         
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(path), exist_ok=True)
         
         try:
-            config_data = config.model_dump(exclude_none=True)
             with open(path, 'w', encoding='utf-8') as file:
-                yaml.dump(config_data, file, default_flow_style=False, indent=2)
+                self.write_config(config, file)
         except IOError as e:
             raise create_configuration_error(
                 f"Cannot write configuration file: {e}",
@@ -199,6 +231,18 @@ class ConfigManager:
                 original_error=e
             ) from e
 
+    def write_config(self, config: ConfigFile, stream: TextIO) -> None:
+        """Serialize configuration as YAML to an open text stream.
+        
+        Args:
+            config: Configuration object to save
+            stream: Writable text stream receiving the YAML document
+        """
+        import yaml
+        
+        config_data = config.model_dump(exclude_none=True)
+        yaml.dump(config_data, stream, default_flow_style=False, indent=2)
+
     def validate_config(self, config_data: Dict, config_path: Optional[str] = None) -> ConfigFile:
         """Validate configuration using Pydantic models.
         
@@ -4,7 +4,7 @@ EclairCP user interface components module.
 
 import sys
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
@@ -28,6 +28,31 @@ from .exceptions import (
 )
 
 
+def _render_original_error(
+    console: Console,
+    original_error: Exception,
+    last: Optional[Tuple[Exception, Text]],
+) -> Tuple[Exception, Text]:
+    """Render an original error, reusing ``last`` if it holds the same exception.
+
+    Displays keep only the most recently rendered pair, so retry loops that
+    show the same exception only pay for markup parsing once.
+
+    Args:
+        console: Console used to parse the markup
+        original_error: Exception to render
+        last: Previously rendered ``(error, text)`` pair, if any
+
+    Returns:
+        The ``(error, text)`` pair for ``original_error``
+    """
+    if last is not None and last[0] is original_error:
+        return last
+    return original_error, console.render_str(
+        f"[dim]{type(original_error).__name__}: {original_error}[/dim]"
+    )
+
+
 class StreamingDisplay:
     """Real-time response rendering with Rich formatting."""
 
@@ -40,6 +65,7 @@ class StreamingDisplay:
         self.console = console or Console()
         self._current_text = ""
         self._live_display: Optional[Live] = None
+        self._last_original_error: Optional[Tuple[Exception, Text]] = None
 
     def stream_text(self, text: str) -> None:
         """
@@ -476,7 +502,10 @@ class StreamingDisplay:
     
     def _show_original_error(self, original_error: Exception) -> None:
         """Display original error information."""
-        original_text = f"[dim]{type(original_error).__name__}: {str(original_error)}[/dim]"
+        self._last_original_error = _render_original_error(
+            self.console, original_error, self._last_original_error
+        )
+        original_text = self._last_original_error[1]
         original_panel = Panel(
             original_text,
             title="🔍 Original Error",
@@ -702,6 +731,7 @@ class StatusDisplay:
             console: Rich console instance, creates new one if None
         """
         self.console = console or Console()
+        self._last_original_error: Optional[Tuple[Exception, Text]] = None
 
     def show_connection_status(
         self,
@@ -1021,7 +1051,10 @@ class StatusDisplay:
     
     def _show_original_error(self, original_error: Exception) -> None:
         """Display original error information."""
-        original_text = f"[dim]{type(original_error).__name__}: {str(original_error)}[/dim]"
+        self._last_original_error = _render_original_error(
+            self.console, original_error, self._last_original_error
+        )
+        original_text = self._last_original_error[1]
         original_panel = Panel(
             original_text,
             title="🔍 Original Error",
@@ -0,0 +1,221 @@
+"""
+Shared pytest fixtures for EclairCP tests.
+"""
+
+from io import StringIO
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import yaml
+from rich.console import Console
+
+import eclaircp.mcp
+import eclaircp.session
+import eclaircp.ui
+from eclaircp.cli import CLIApp
+from eclaircp.config import ConfigManager, MCPServerConfig
+from eclaircp.ui import StatusDisplay, StreamingDisplay
+
+
+# Prefer libyaml's C emitter when PyYAML was built with it.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Read-only session details; CLIApp only reads them with .get().
+SESSION_INFO = MappingProxyType({
+    'active': True,
+    'server_name': 'test-server',
+    'model': 'test-model',
+    'tools_loaded': 5,
+    'mcp_connected': True,
+    'connection_status': {}
+})
+
+# The attributes CLIApp touches on each component; spec_set lists avoid
+# introspecting the real classes.
+MCP_CLIENT_SPEC = (
+    'connect', 'disconnect', 'is_connected', 'get_connection_status',
+    'list_tools', 'get_strands_tools'
+)
+SESSION_SPEC = (
+    'start_session', 'end_session', 'process_input', 'is_active',
+    'get_session_info', 'mcp_client'
+)
+
+# Reused across tests; the mock_mcp_client, mock_session_manager and
+# mock_display fixtures reset and re-wire them. The client is named so that
+# assigning it to ``session.mcp_client`` does not make it a child that the
+# session's reset would clear.
+_SHARED_MCP_CLIENT = Mock(spec_set=MCP_CLIENT_SPEC, name="mcp_client")
+_SHARED_MCP_CLIENT.connect = AsyncMock()
+_SHARED_MCP_CLIENT.disconnect = AsyncMock()
+_SHARED_MCP_CLIENT.list_tools = AsyncMock()
+
+_SHARED_SESSION_MANAGER = Mock(spec_set=SESSION_SPEC)
+_SHARED_SESSION_MANAGER.start_session = AsyncMock()
+_SHARED_SESSION_MANAGER.end_session = AsyncMock()
+# CLIApp iterates process_input with ``async for``, so it is a plain Mock
+# whose side effect returns an async iterator.
+_SHARED_SESSION_MANAGER.process_input = Mock()
+
+_SHARED_DISPLAY = Mock(spec=StreamingDisplay)
+
+
+async def _replay(events):
+    """Yield pre-built stream events as an async iterator."""
+    for event in events:
+        yield event
+
+
+@pytest.fixture(scope="session")
+def manager():
+    """Stateless configuration manager shared across the test session."""
+    return ConfigManager()
+
+
+@pytest.fixture(scope="session")
+def base_server_config():
+    """Validated baseline server configuration.
+
+    Shared read-only across the session; tests that need a variant should use
+    ``base_server_config.model_copy(update=...)`` instead of mutating it.
+    """
+    return MCPServerConfig(
+        name="test-server",
+        command="uvx",
+        args=["test-package"]
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_rich():
+    """Render once up front so Rich's lazy setup is not charged to the first test."""
+    Console(file=StringIO()).print("warmup")
+
+
+@pytest.fixture
+def mock_mcp_stack(monkeypatch):
+    """Replace the MCP stdio transport and client session with mocks.
+
+    ``stdio_client`` yields a ``(read, write)`` pair and ``ClientSession``
+    returns the yielded session mock, so tests only configure its
+    ``initialize`` and ``list_tools`` behaviour.
+    """
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = (Mock(), Mock())
+    mock_context.__aexit__.return_value = None
+    mock_session = AsyncMock()
+    monkeypatch.setattr("eclaircp.mcp.stdio_client", lambda *a, **k: mock_context)
+    monkeypatch.setattr("eclaircp.mcp.ClientSession", lambda *a, **k: mock_session)
+    return mock_session
+
+
+@pytest.fixture(scope="session")
+def write_config_file(tmp_path_factory):
+    """Return a helper that dumps a configuration dict to a fresh YAML file.
+
+    Files live under the session's temporary directory, so pytest cleans
+    them up.
+    """
+    def write(config_dict):
+        path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+        path.write_text(yaml.dump(config_dict, Dumper=YAML_DUMPER))
+        return str(path)
+
+    return write
+
+
+@pytest.fixture(scope="session")
+def temp_config_text(temp_config_file):
+    """YAML text of ``temp_config_file``, read once per session."""
+    with open(temp_config_file, encoding="utf-8") as file:
+        return file.read()
+
+
+@pytest.fixture
+def cached_config_loader(monkeypatch, temp_config_file, temp_config_text):
+    """Parse ``temp_config_text`` from memory when ``temp_config_file`` is loaded.
+
+    Modules that use this provide ``temp_config_file``. The file stays on disk
+    because ``CLIApp.validate_config_file`` checks that the path exists, but
+    its YAML is still parsed and validated on every load. Other paths go
+    through the real ``ConfigManager.load_config``.
+    """
+    original_load_config = ConfigManager.load_config
+
+    def load_config(self, path):
+        if path == temp_config_file:
+            return self.load_from_string(temp_config_text)
+        return original_load_config(self, path)
+
+    monkeypatch.setattr(ConfigManager, "load_config", load_config)
+
+
+@pytest.fixture
+def mock_mcp_client():
+    """Provide the shared MCP client mock, reset to connect successfully."""
+    client = _SHARED_MCP_CLIENT
+    client.reset_mock(return_value=True, side_effect=True)
+    client.connect.return_value = True
+    client.is_connected.return_value = True
+    client.list_tools.return_value = []
+    client.get_strands_tools.return_value = []
+    client.get_connection_status.return_value.error_message = None
+    client.get_connection_status.return_value.connection_time = None
+    return client
+
+
+@pytest.fixture
+def mock_session_manager():
+    """Provide the shared session manager mock, reset to an active session."""
+    session = _SHARED_SESSION_MANAGER
+    session.reset_mock(return_value=True, side_effect=True)
+    session.is_active.return_value = True
+    session.get_session_info.return_value = SESSION_INFO
+    return session
+
+
+@pytest.fixture
+def mock_display():
+    """Provide the shared streaming display mock, fully reset."""
+    _SHARED_DISPLAY.reset_mock(return_value=True, side_effect=True)
+    return _SHARED_DISPLAY
+
+
+@pytest.fixture(scope="module")
+def app():
+    """CLI application shared by a test module.
+
+    CLIApp only holds a console and a stateless ConfigManager; tests patch
+    ``app.console.input`` with context managers that are undone on exit.
+    """
+    return CLIApp()
+
+
+@pytest.fixture
+def patched_app(monkeypatch, mock_mcp_client, mock_session_manager, mock_display):
+    """Replace the components built by CLIApp's session workflow with mocks.
+
+    ``replay(*event_lists)`` makes ``session.process_input`` stream one event
+    list per call, and nothing once the lists run out.
+    """
+    mocks = SimpleNamespace(
+        client=mock_mcp_client,
+        session=mock_session_manager,
+        display=mock_display,
+        status=Mock(spec=StatusDisplay),
+    )
+    mocks.session.mcp_client = mocks.client
+
+    def replay(*event_lists):
+        responses = iter(event_lists)
+        mocks.session.process_input.side_effect = (
+            lambda user_input: _replay(next(responses, ()))
+        )
+
+    mocks.replay = replay
+    monkeypatch.setattr(eclaircp.mcp, "MCPClientManager", lambda *a, **k: mocks.client)
+    monkeypatch.setattr(eclaircp.session, "SessionManager", lambda *a, **k: mocks.session)
+    monkeypatch.setattr(eclaircp.ui, "StreamingDisplay", lambda *a, **k: mocks.display)
+    monkeypatch.setattr(eclaircp.ui, "StatusDisplay", lambda *a, **k: mocks.status)
+    return mocks
@@ -2,15 +2,69 @@
 Tests for the configuration module.
 """
 
+import os
+import re
 import pytest
+import yaml
 from datetime import datetime
+from io import StringIO
 from pydantic import ValidationError
 from eclaircp.config import (
     MCPServerConfig, SessionConfig, ConfigFile,
-    ConnectionStatus, StreamEvent, StreamEventType, ToolInfo
+    ConnectionStatus, StreamEvent, StreamEventType, ToolInfo,
+    ConfigurationError
 )
 
 
+EXAMPLE_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "examples",
+    "config.yaml"
+)
+
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+FIXED_NOW_ISO = FIXED_NOW.isoformat()
+
+BASE_SERVER_KWARGS = dict(name="test-server", command="uvx", args=["test-package"])
+
+# Known-good configuration document covering every server field
+FULL_CONFIG_YAML = """\
+servers:
+  test-server:
+    command: uvx
+    args:
+      - test-package
+    description: Test server
+    env:
+      TEST_VAR: test_value
+    timeout: 60
+default_session:
+  server_name: test-server
+  model: test-model
+"""
+
+# Required string fields left empty or blank
+EMPTY_FIELD_CASES = [
+    pytest.param(MCPServerConfig, dict(name="test-server", command="", args=["test-package"]), id="server-command"),
+    pytest.param(SessionConfig, dict(server_name=""), id="session-server-name"),
+    pytest.param(ToolInfo, dict(name="", description="A test tool"), id="tool-name"),
+    pytest.param(ToolInfo, dict(name="   ", description="A test tool"), id="tool-name-whitespace"),
+]
+
+# Expected ConfigurationError messages
+RE_NOT_FOUND = re.compile(r"Configuration file not found")
+RE_INVALID_YAML = re.compile(r"Invalid YAML")
+RE_EMPTY = re.compile(r"Configuration file is empty")
+
+# (value, expected exception) pairs; None means the value is accepted
+TIMEOUT_CASES = [(60, None), (0, ValidationError), (400, ValidationError)]
+MAX_CONTEXT_LENGTH_CASES = [
+    (50000, None),
+    (500, ValidationError),
+    (2000000, ValidationError),
+]
+
+
 def test_mcp_server_config_validation():
     """Test MCPServerConfig validation."""
     config = MCPServerConfig(
@@ -24,16 +78,6 @@ def test_mcp_server_config_validation():
     assert config.args == ["test-package"]
 
 
-def test_mcp_server_config_empty_command():
-    """Test that empty command raises validation error."""
-    with pytest.raises(ValidationError):
-        MCPServerConfig(
-            name="test-server",
-            command="",
-            args=["test-package"]
-        )
-
-
 def test_session_config_validation():
     """Test SessionConfig validation."""
     config = SessionConfig(server_name="test-server")
@@ -41,14 +85,9 @@ def test_session_config_validation():
     assert config.model == "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 
 
-def test_config_file_validation():
+def test_config_file_validation(base_server_config):
     """Test ConfigFile validation."""
-    server_config = MCPServerConfig(
-        name="test-server",
-        command="uvx",
-        args=["test-package"]
-    )
-    config_file = ConfigFile(servers={"test": server_config})
+    config_file = ConfigFile(servers={"test": base_server_config})
     assert "test" in config_file.servers
 
 
@@ -68,53 +107,22 @@ def test_mcp_server_config_args_whitespace():
     assert config.args == ["test-package", "another-arg"]
 
 
-def test_mcp_server_config_defaults():
+def test_mcp_server_config_defaults(base_server_config):
     """Test MCPServerConfig default values."""
-    config = MCPServerConfig(
-        name="test-server",
-        command="uvx",
-        args=["test-package"]
-    )
-    assert config.description == ""
-    assert config.env == {}
-    assert config.timeout == 30
-    assert config.retry_attempts == 3
+    assert base_server_config.description == ""
+    assert base_server_config.env == {}
+    assert base_server_config.timeout == 30
+    assert base_server_config.retry_attempts == 3
 
 
-def test_mcp_server_config_timeout_validation():
+@pytest.mark.parametrize("timeout,exc", TIMEOUT_CASES)
+def test_mcp_server_config_timeout_validation(timeout, exc):
     """Test timeout field validation."""
-    # Valid timeout
-    config = MCPServerConfig(
-        name="test-server",
-        command="uvx",
-        args=["test-package"],
-        timeout=60
-    )
-    assert config.timeout == 60
-    
-    # Invalid timeout (too low)
-    with pytest.raises(ValidationError):
-        MCPServerConfig(
-            name="test-server",
-            command="uvx",
-            args=["test-package"],
-            timeout=0
-        )
-    
-    # Invalid timeout (too high)
-    with pytest.raises(ValidationError):
-        MCPServerConfig(
-            name="test-server",
-            command="uvx",
-            args=["test-package"],
-            timeout=400
-        )
-
-
-def test_session_config_empty_server_name():
-    """Test that empty server name raises validation error."""
-    with pytest.raises(ValidationError):
-        SessionConfig(server_name="")
+    if exc:
+        with pytest.raises(exc):
+            MCPServerConfig(**BASE_SERVER_KWARGS, timeout=timeout)
+    else:
+        assert MCPServerConfig(**BASE_SERVER_KWARGS, timeout=timeout).timeout == timeout
 
 
 def test_session_config_server_name_whitespace():
@@ -123,28 +131,15 @@ def test_session_config_server_name_whitespace():
     assert config.server_name == "test-server"
 
 
-def test_session_config_max_context_length_validation():
+@pytest.mark.parametrize("max_context_length,exc", MAX_CONTEXT_LENGTH_CASES)
+def test_session_config_max_context_length_validation(max_context_length, exc):
     """Test max_context_length field validation."""
-    # Valid context length
-    config = SessionConfig(
-        server_name="test-server",
-        max_context_length=50000
-    )
-    assert config.max_context_length == 50000
-    
-    # Invalid context length (too low)
-    with pytest.raises(ValidationError):
-        SessionConfig(
-            server_name="test-server",
-            max_context_length=500
-        )
-    
-    # Invalid context length (too high)
-    with pytest.raises(ValidationError):
-        SessionConfig(
-            server_name="test-server",
-            max_context_length=2000000
-        )
+    if exc:
+        with pytest.raises(exc):
+            SessionConfig(server_name="test-server", max_context_length=max_context_length)
+    else:
+        config = SessionConfig(server_name="test-server", max_context_length=max_context_length)
+        assert config.max_context_length == max_context_length
 
 
 def test_connection_status_creation():
@@ -152,19 +147,19 @@ def test_connection_status_creation():
     status = ConnectionStatus(
         server_name="test-server",
         connected=True,
-        connection_time=datetime.now(),
+        connection_time=FIXED_NOW,
         available_tools=["tool1", "tool2"]
     )
     assert status.server_name == "test-server"
     assert status.connected is True
-    assert status.connection_time is not None
+    assert status.connection_time == FIXED_NOW
     assert status.error_message is None
     assert status.available_tools == ["tool1", "tool2"]
 
 
 def test_connection_status_defaults():
     """Test ConnectionStatus default values."""
-    status = ConnectionStatus(
+    status = ConnectionStatus.model_construct(
         server_name="test-server",
         connected=False
     )
@@ -175,14 +170,13 @@ def test_connection_status_defaults():
 
 def test_connection_status_json_serialization():
     """Test ConnectionStatus JSON serialization with datetime."""
-    now = datetime.now()
     status = ConnectionStatus(
         server_name="test-server",
         connected=True,
-        connection_time=now
+        connection_time=FIXED_NOW
     )
     json_data = status.model_dump(mode='json')
-    assert json_data['connection_time'] == now.isoformat()
+    assert json_data['connection_time'] == FIXED_NOW_ISO
 
 
 def test_stream_event_type_enum():
@@ -196,7 +190,7 @@ def test_stream_event_type_enum():
 
 def test_stream_event_creation():
     """Test StreamEvent model creation."""
-    event = StreamEvent(
+    event = StreamEvent.model_construct(
         event_type=StreamEventType.TEXT,
         data="Hello, world!"
     )
@@ -224,10 +218,11 @@ def test_stream_event_json_serialization():
     """Test StreamEvent JSON serialization with datetime."""
     event = StreamEvent(
         event_type=StreamEventType.TEXT,
-        data="test data"
+        data="test data",
+        timestamp=FIXED_NOW
     )
     json_data = event.model_dump(mode='json')
-    assert json_data['timestamp'] == event.timestamp.isoformat()
+    assert json_data['timestamp'] == FIXED_NOW_ISO
 
 
 def test_tool_info_creation():
@@ -244,22 +239,13 @@ def test_tool_info_creation():
 
 def test_tool_info_defaults():
     """Test ToolInfo default values."""
-    tool = ToolInfo(
+    tool = ToolInfo.model_construct(
         name="test_tool",
         description="A test tool"
     )
     assert tool.parameters == {}
 
 
-def test_tool_info_empty_name():
-    """Test that empty tool name raises validation error."""
-    with pytest.raises(ValidationError):
-        ToolInfo(
-            name="",
-            description="A test tool"
-        )
-
-
 def test_tool_info_name_whitespace():
     """Test that tool name whitespace is properly stripped."""
     tool = ToolInfo(
@@ -269,21 +255,16 @@ def test_tool_info_name_whitespace():
     assert tool.name == "test_tool"
 
 
-def test_tool_info_whitespace_only_name():
-    """Test that whitespace-only tool name raises validation error."""
+@pytest.mark.parametrize("model,kwargs", EMPTY_FIELD_CASES)
+def test_empty_field_rejected(model, kwargs):
+    """Test that empty or whitespace-only required fields raise validation error."""
     with pytest.raises(ValidationError):
-        ToolInfo(
-            name="   ",
-            description="A test tool"
-        )
+        model(**kwargs)
 
 
 # ConfigManager tests
-def test_config_manager_validate_config():
+def test_config_manager_validate_config(manager):
     """Test ConfigManager validate_config method."""
-    from eclaircp.config import ConfigManager
-    
-    manager = ConfigManager()
     config_data = {
         "servers": {
             "test-server": {
@@ -300,11 +281,8 @@ def test_config_manager_validate_config():
     assert config.servers["test-server"].name == "test-server"
 
 
-def test_config_manager_validate_config_invalid():
+def test_config_manager_validate_config_invalid(manager):
     """Test ConfigManager validate_config with invalid data."""
-    from eclaircp.config import ConfigManager, ConfigurationError
-    
-    manager = ConfigManager()
     config_data = {
         "servers": {
             "test-server": {
@@ -318,22 +296,16 @@ def test_config_manager_validate_config_invalid():
         manager.validate_config(config_data)
 
 
-def test_config_manager_validate_config_empty_servers():
+def test_config_manager_validate_config_empty_servers(manager):
     """Test ConfigManager validate_config with empty servers."""
-    from eclaircp.config import ConfigManager, ConfigurationError
-    
-    manager = ConfigManager()
     config_data = {"servers": {}}
     
     with pytest.raises(ConfigurationError):
         manager.validate_config(config_data)
 
 
-def test_config_manager_validate_config_with_session():
+def test_config_manager_validate_config_with_session(manager):
     """Test ConfigManager validate_config with session configuration."""
-    from eclaircp.config import ConfigManager
-    
-    manager = ConfigManager()
     config_data = {
         "servers": {
             "test-server": {
@@ -355,31 +327,32 @@ def test_config_manager_validate_config_with_session():
     assert config.default_session.model == "custom-model"
 
 
-def test_config_manager_load_config_file_not_found():
+def test_config_manager_load_config_file_not_found(manager):
     """Test ConfigManager load_config with non-existent file."""
-    from eclaircp.config import ConfigManager, ConfigurationError
-    
-    manager = ConfigManager()
-    
-    with pytest.raises(ConfigurationError, match="Configuration file not found"):
+    with pytest.raises(ConfigurationError, match=RE_NOT_FOUND):
         manager.load_config("/non/existent/file.yaml")
 
 
-def test_config_manager_save_and_load_config(tmp_path):
-    """Test ConfigManager save_config and load_config roundtrip."""
-    from eclaircp.config import ConfigManager
-    
-    manager = ConfigManager()
-    
+def test_config_manager_load_config_invalid_yaml(manager):
+    """Test ConfigManager rejects invalid YAML content."""
+    with pytest.raises(ConfigurationError, match=RE_INVALID_YAML):
+        manager.load_from_string("invalid: yaml: content: [")
+
+
+def test_config_manager_load_config_empty_file(manager):
+    """Test ConfigManager rejects empty configuration content."""
+    with pytest.raises(ConfigurationError, match=RE_EMPTY):
+        manager.load_from_string("")
+
+
+def test_config_manager_write_config(manager, base_server_config):
+    """Test ConfigManager write_config emits the expected YAML document."""
     # Create a test configuration
-    server_config = MCPServerConfig(
-        name="test-server",
-        command="uvx",
-        args=["test-package"],
-        description="Test server",
-        env={"TEST_VAR": "test_value"},
-        timeout=60
-    )
+    server_config = base_server_config.model_copy(update={
+        "description": "Test server",
+        "env": {"TEST_VAR": "test_value"},
+        "timeout": 60
+    })
     session_config = SessionConfig(
         server_name="test-server",
         model="test-model"
@@ -389,12 +362,25 @@ def test_config_manager_save_and_load_config(tmp_path):
         default_session=session_config
     )
     
-    # Save configuration
-    config_path = tmp_path / "test_config.yaml"
-    manager.save_config(config, str(config_path))
+    # Write configuration
+    buffer = StringIO()
+    manager.write_config(config, buffer)
     
-    # Load configuration back
-    loaded_config = manager.load_config(str(config_path))
+    # Inspect the raw YAML data without re-validating it
+    written = yaml.safe_load(buffer.getvalue())
+    server_data = written["servers"]["test-server"]
+    assert server_data["command"] == "uvx"
+    assert server_data["args"] == ["test-package"]
+    assert server_data["description"] == "Test server"
+    assert server_data["env"] == {"TEST_VAR": "test_value"}
+    assert server_data["timeout"] == 60
+    assert written["default_session"]["server_name"] == "test-server"
+    assert written["default_session"]["model"] == "test-model"
+
+
+def test_config_manager_read_config(manager):
+    """Test ConfigManager read_config validates a complete YAML document."""
+    loaded_config = manager.read_config(StringIO(FULL_CONFIG_YAML))
     
     # Verify the loaded configuration
     assert "test-server" in loaded_config.servers
@@ -410,47 +396,25 @@ def test_config_manager_save_and_load_config(tmp_path):
     assert loaded_config.default_session.model == "test-model"
 
 
-def test_config_manager_load_config_invalid_yaml(tmp_path):
-    """Test ConfigManager load_config with invalid YAML."""
-    from eclaircp.config import ConfigManager, ConfigurationError
-    
-    manager = ConfigManager()
-    
-    # Create invalid YAML file
-    config_path = tmp_path / "invalid.yaml"
-    config_path.write_text("invalid: yaml: content: [")
-    
-    with pytest.raises(ConfigurationError, match="Invalid YAML"):
-        manager.load_config(str(config_path))
-
+def test_config_manager_load_from_string(manager):
+    """Test ConfigManager load_from_string validates a YAML document."""
+    loaded_config = manager.load_from_string(FULL_CONFIG_YAML)
 
-def test_config_manager_load_config_empty_file(tmp_path):
-    """Test ConfigManager load_config with empty file."""
-    from eclaircp.config import ConfigManager, ConfigurationError
-    
-    manager = ConfigManager()
-    
-    # Create empty YAML file
-    config_path = tmp_path / "empty.yaml"
-    config_path.write_text("")
-    
-    with pytest.raises(ConfigurationError, match="Configuration file is empty"):
-        manager.load_config(str(config_path))
+    server = loaded_config.servers["test-server"]
+    assert server.name == "test-server"
+    assert server.command == "uvx"
+    assert server.args == ["test-package"]
+    assert server.description == "Test server"
+    assert server.env == {"TEST_VAR": "test_value"}
+    assert server.timeout == 60
+    assert loaded_config.default_session.server_name == "test-server"
+    assert loaded_config.default_session.model == "test-model"
 
 
-def test_config_manager_save_config_creates_directory(tmp_path):
+def test_config_manager_save_config_creates_directory(manager, base_server_config, tmp_path):
     """Test ConfigManager save_config creates directory if it doesn't exist."""
-    from eclaircp.config import ConfigManager
-    
-    manager = ConfigManager()
-    
     # Create a test configuration
-    server_config = MCPServerConfig(
-        name="test-server",
-        command="uvx",
-        args=["test-package"]
-    )
-    config = ConfigFile(servers={"test-server": server_config})
+    config = ConfigFile(servers={"test-server": base_server_config})
     
     # Save to a path with non-existent directory
     config_path = tmp_path / "subdir" / "config.yaml"
@@ -464,26 +428,10 @@ def test_config_manager_save_config_creates_directory(tmp_path):
     assert "test-server" in loaded_config.servers
 
 
-def test_example_config_file_loads():
+@pytest.mark.skipif(not os.path.exists(EXAMPLE_CONFIG_PATH), reason="Example config file not found")
+def test_example_config_file_loads(manager):
     """Test that the example configuration file loads correctly."""
-    from eclaircp.config import ConfigManager
-    import os
-    
-    manager = ConfigManager()
-    
-    # Get the path to the example config file
-    example_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        "examples",
-        "config.yaml"
-    )
-    
-    # Skip test if example file doesn't exist
-    if not os.path.exists(example_path):
-        pytest.skip("Example config file not found")
-    
-    # Load the example configuration
-    config = manager.load_config(example_path)
+    config = manager.load_config(EXAMPLE_CONFIG_PATH)
     
     # Verify basic structure
     assert isinstance(config, ConfigFile)
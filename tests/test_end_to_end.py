@@ -2,18 +2,185 @@
 End-to-end tests for complete EclairCP workflows.
 """
 
-import asyncio
-import tempfile
 import yaml
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from pathlib import Path
+from unittest.mock import Mock, call, patch
 
-from eclaircp.cli import CLIApp
-from eclaircp.config import ConfigFile, MCPServerConfig, StreamEvent, StreamEventType
+import eclaircp.ui
+from eclaircp.config import (
+    MCPServerConfig, StreamEvent, StreamEventType, ToolInfo
+)
 
 
-@pytest.fixture
+# Every test here is async and shares one event loop for the module, and
+# loads of the shared config file parse its cached YAML text.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.usefixtures("cached_config_loader"),
+]
+
+ECHO_SERVER_CONFIG = MCPServerConfig(name='test', command='echo', args=['test'])
+
+AWS_TOOLS = [
+    ToolInfo(name=name, description=description) for name, description in [
+        ('search_documentation', 'Search AWS documentation'),
+        ('read_documentation', 'Read AWS documentation page'),
+        ('recommend', 'Get content recommendations'),
+    ]
+]
+
+GITHUB_TOOLS = [
+    ToolInfo(name=name, description=description) for name, description in [
+        ('search_repositories', 'Search GitHub repositories'),
+        ('get_repository', 'Get repository information'),
+        ('list_issues', 'List repository issues'),
+        ('create_issue', 'Create a new issue'),
+    ]
+]
+
+GITHUB_PROJECT_TOOLS = [
+    ToolInfo(name=name, description=description) for name, description in [
+        ('list_issues', 'List repository issues'),
+        ('create_issue', 'Create a new issue'),
+        ('list_pull_requests', 'List pull requests'),
+    ]
+]
+
+FILESYSTEM_TOOLS = [
+    ToolInfo(name=name, description=description) for name, description in [
+        ('read_file', 'Read file contents'),
+        ('write_file', 'Write file contents'),
+        ('list_directory', 'List directory contents'),
+    ]
+]
+
+
+AWS_CONVERSATION_EVENTS = (
+    StreamEvent(event_type=StreamEventType.TEXT, data="I'll help you search AWS documentation."),
+    StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+        'tool_name': 'search_documentation',
+        'arguments': {'search_phrase': 'S3 bucket policies'},
+        'result': 'Found 15 documentation pages about S3 bucket policies'
+    }),
+    StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the search results for S3 bucket policies."),
+    StreamEvent(event_type=StreamEventType.COMPLETE, data="Search complete")
+)
+
+GITHUB_EXPLORATION_EVENTS = (
+    StreamEvent(event_type=StreamEventType.TEXT, data="Let me search for Python repositories."),
+    StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+        'tool_name': 'search_repositories',
+        'arguments': {'query': 'language:python stars:>1000'},
+        'result': 'Found 50 popular Python repositories'
+    }),
+    StreamEvent(event_type=StreamEventType.TEXT, data=" Here are some popular Python repositories."),
+    StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+        'tool_name': 'get_repository',
+        'arguments': {'owner': 'python', 'repo': 'cpython'},
+        'result': 'Repository: python/cpython - The Python programming language'
+    }),
+    StreamEvent(event_type=StreamEventType.TEXT, data=" I found the CPython repository details."),
+    StreamEvent(event_type=StreamEventType.COMPLETE, data="Exploration complete")
+)
+
+DOCS_RESEARCH_RESPONSES = (
+    (
+        StreamEvent(event_type=StreamEventType.TEXT, data="I'll help you research Lambda functions with S3 triggers."),
+        StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+            'tool_name': 'search_documentation',
+            'arguments': {'search_phrase': 'Lambda S3 triggers'},
+            'result': 'Found comprehensive documentation on Lambda S3 integration'
+        }),
+        StreamEvent(event_type=StreamEventType.TEXT, data=" Here's what I found about Lambda S3 triggers."),
+        StreamEvent(event_type=StreamEventType.COMPLETE, data="Search complete")
+    ),
+    (
+        StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+            'tool_name': 'read_documentation',
+            'arguments': {'url': 'https://docs.aws.amazon.com/lambda/latest/dg/with-s3.html'},
+            'result': 'Detailed documentation on configuring S3 event notifications for Lambda'
+        }),
+        StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the details on S3 event notifications."),
+        StreamEvent(event_type=StreamEventType.COMPLETE, data="Read complete")
+    ),
+    (
+        StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+            'tool_name': 'search_documentation',
+            'arguments': {'search_phrase': 'Lambda S3 IAM permissions'},
+            'result': 'Found IAM policy examples for Lambda S3 access'
+        }),
+        StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the required IAM permissions."),
+        StreamEvent(event_type=StreamEventType.COMPLETE, data="IAM search complete")
+    )
+)
+
+TEAM_WORKFLOW_RESPONSES = (
+    (
+        StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+            'tool_name': 'list_issues',
+            'arguments': {'owner': 'team', 'repo': 'project', 'state': 'open'},
+            'result': 'Found 12 open issues including 3 high priority bugs'
+        }),
+        StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the current open issues."),
+        StreamEvent(event_type=StreamEventType.COMPLETE, data="Issues listed")
+    ),
+    (
+        StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+            'tool_name': 'create_issue',
+            'arguments': {
+                'owner': 'team', 
+                'repo': 'project',
+                'title': 'Fix authentication bug',
+                'body': 'Users report login failures after recent update'
+            },
+            'result': 'Created issue #47: Fix authentication bug'
+        }),
+        StreamEvent(event_type=StreamEventType.TEXT, data=" Created the new issue for the authentication bug."),
+        StreamEvent(event_type=StreamEventType.COMPLETE, data="Issue created")
+    ),
+    (
+        StreamEvent(event_type=StreamEventType.TOOL_USE, data={
+            'tool_name': 'list_pull_requests',
+            'arguments': {'owner': 'team', 'repo': 'project', 'state': 'open'},
+            'result': 'Found 5 open pull requests awaiting review'
+        }),
+        StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the pull requests needing review."),
+        StreamEvent(event_type=StreamEventType.COMPLETE, data="PRs listed")
+    )
+)
+
+TEAM_WORKFLOW_TOOL_CALLS = [
+    call('list_issues', {'owner': 'team', 'repo': 'project', 'state': 'open'}),
+    call('create_issue', {
+        'owner': 'team',
+        'repo': 'project',
+        'title': 'Fix authentication bug',
+        'body': 'Users report login failures after recent update'
+    }),
+    call('list_pull_requests', {'owner': 'team', 'repo': 'project', 'state': 'open'}),
+]
+
+SESSION_ERROR_EVENTS = (
+    StreamEvent(event_type=StreamEventType.ERROR, data="Simulated processing error"),
+)
+
+
+SESSION_MODEL = 'us.anthropic.claude-3-7-sonnet-20250219-v1:0'
+
+
+def _session_info(server_name, tools_loaded, model=SESSION_MODEL):
+    """Build the dictionary returned by a connected session's get_session_info."""
+    return {
+        'active': True,
+        'server_name': server_name,
+        'model': model,
+        'tools_loaded': tools_loaded,
+        'mcp_connected': True,
+        'connection_status': {}
+    }
+
+
+@pytest.fixture(scope="session")
 def realistic_config():
     """Create a realistic configuration for testing."""
     return {
@@ -52,193 +219,69 @@ def realistic_config():
     }
 
 
-@pytest.fixture
-def temp_config_file(realistic_config):
-    """Create a temporary configuration file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(realistic_config, f)
-        yield f.name
-    
-    # Cleanup
-    Path(f.name).unlink(missing_ok=True)
+@pytest.fixture(scope="session")
+def temp_config_file(realistic_config, write_config_file):
+    """Create a configuration file shared by the whole test session."""
+    return write_config_file(realistic_config)
 
 
 class TestCompleteUserJourneys:
     """Test complete user journeys from start to finish."""
     
-    @pytest.mark.asyncio
-    async def test_developer_testing_aws_docs_server(self, temp_config_file):
-        """Test a developer testing AWS documentation server."""
-        app = CLIApp()
-        
-        # Simulate realistic AWS docs interaction
-        aws_tools = [
-            Mock(name='search_documentation', description='Search AWS documentation'),
-            Mock(name='read_documentation', description='Read AWS documentation page'),
-            Mock(name='recommend', description='Get content recommendations')
-        ]
-        
-        conversation_events = [
-            StreamEvent(event_type=StreamEventType.TEXT, data="I'll help you search AWS documentation."),
-            StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                'tool_name': 'search_documentation',
-                'arguments': {'search_phrase': 'S3 bucket policies'},
-                'result': 'Found 15 documentation pages about S3 bucket policies'
-            }),
-            StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the search results for S3 bucket policies."),
-            StreamEvent(event_type=StreamEventType.COMPLETE, data="Search complete")
-        ]
-        
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.session.SessionManager') as mock_session_class, \
-             patch('eclaircp.ui.StreamingDisplay') as mock_display_class, \
-             patch('eclaircp.ui.StatusDisplay'), \
-             patch.object(app.console, 'input', side_effect=[
-                 'Can you help me find information about S3 bucket policies?',
-                 '/tools',
-                 '/status',
-                 '/exit'
-             ]):
-            
-            # Setup realistic AWS docs server mock
-            mock_client = Mock()
-            mock_client.connect = AsyncMock(return_value=True)
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=True)
-            mock_client.get_connection_status = Mock()
-            mock_client.get_connection_status.return_value.connection_time = None
-            mock_client.get_connection_status.return_value.available_tools = [
-                'search_documentation', 'read_documentation', 'recommend'
-            ]
-            mock_client.list_tools = AsyncMock(return_value=aws_tools)
-            mock_client_class.return_value = mock_client
-            
-            # Setup session with realistic conversation
-            mock_session = Mock()
-            mock_session.start_session = AsyncMock()
-            mock_session.end_session = AsyncMock()
-            
-            call_count = 0
-            async def mock_process_input(user_input):
-                nonlocal call_count
-                if call_count == 0:  # First call with the S3 question
-                    for event in conversation_events:
-                        yield event
-                call_count += 1
-            
-            mock_session.process_input = mock_process_input
-            mock_session.get_session_info = Mock(return_value={
-                'active': True,
-                'server_name': 'aws-docs',
-                'model': 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
-                'tools_loaded': 3,
-                'mcp_connected': True,
-                'connection_status': {}
-            })
-            mock_session.mcp_client = mock_client
-            mock_session_class.return_value = mock_session
-            
-            mock_display = Mock()
-            mock_display_class.return_value = mock_display
-            
-            # Run the complete workflow
-            result = await app.run(temp_config_file, server_name='aws-docs')
-            
-            # Verify the complete journey
-            assert result == 0
-            mock_client.connect.assert_called_once()
-            mock_session.start_session.assert_called_once()
-            mock_session.end_session.assert_called_once()
-            mock_client.disconnect.assert_called_once()
-            
-            # Verify realistic interactions occurred
-            assert mock_display.stream_text_instant.call_count >= 2
-            mock_display.show_tool_usage.assert_called_once()
-            mock_display.show_tool_result.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_developer_exploring_github_server(self, temp_config_file):
-        """Test a developer exploring GitHub server capabilities."""
-        app = CLIApp()
-        
-        # Simulate realistic GitHub interaction
-        github_tools = [
-            Mock(name='search_repositories', description='Search GitHub repositories'),
-            Mock(name='get_repository', description='Get repository information'),
-            Mock(name='list_issues', description='List repository issues'),
-            Mock(name='create_issue', description='Create a new issue')
-        ]
-        
-        exploration_events = [
-            StreamEvent(event_type=StreamEventType.TEXT, data="Let me search for Python repositories."),
-            StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                'tool_name': 'search_repositories',
-                'arguments': {'query': 'language:python stars:>1000'},
-                'result': 'Found 50 popular Python repositories'
-            }),
-            StreamEvent(event_type=StreamEventType.TEXT, data=" Here are some popular Python repositories."),
-            StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                'tool_name': 'get_repository',
-                'arguments': {'owner': 'python', 'repo': 'cpython'},
-                'result': 'Repository: python/cpython - The Python programming language'
-            }),
-            StreamEvent(event_type=StreamEventType.TEXT, data=" I found the CPython repository details."),
-            StreamEvent(event_type=StreamEventType.COMPLETE, data="Exploration complete")
-        ]
-        
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.session.SessionManager') as mock_session_class, \
-             patch('eclaircp.ui.StreamingDisplay') as mock_display_class, \
-             patch('eclaircp.ui.StatusDisplay'), \
-             patch.object(app.console, 'input', side_effect=[
-                 'Show me popular Python repositories and get details about CPython',
-                 '/help',
-                 '/exit'
-             ]):
-            
-            # Setup realistic GitHub server mock
-            mock_client = Mock()
-            mock_client.connect = AsyncMock(return_value=True)
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=True)
-            mock_client.get_connection_status = Mock()
-            mock_client.get_connection_status.return_value.connection_time = None
-            mock_client.get_connection_status.return_value.available_tools = [
-                'search_repositories', 'get_repository', 'list_issues', 'create_issue'
-            ]
-            mock_client.list_tools = AsyncMock(return_value=github_tools)
-            mock_client_class.return_value = mock_client
+    @pytest.mark.parametrize(
+        "server_name,user_inputs,available_tools,tools,events,min_text_calls,tool_calls",
+        [
+            (
+                'aws-docs',
+                [
+                    'Can you help me find information about S3 bucket policies?',
+                    '/tools',
+                    '/status',
+                    '/exit'
+                ],
+                ['search_documentation', 'read_documentation', 'recommend'],
+                AWS_TOOLS,
+                AWS_CONVERSATION_EVENTS,
+                2,
+                1,
+            ),
+            (
+                'github',
+                [
+                    'Show me popular Python repositories and get details about CPython',
+                    '/help',
+                    '/exit'
+                ],
+                ['search_repositories', 'get_repository', 'list_issues', 'create_issue'],
+                GITHUB_TOOLS,
+                GITHUB_EXPLORATION_EVENTS,
+                3,
+                2,
+            ),
+        ],
+        ids=["aws-docs", "github"],
+    )
+    async def test_developer_server_journey(
+        self, app, patched_app, temp_config_file, server_name, user_inputs,
+        available_tools, tools, events, min_text_calls, tool_calls
+    ):
+        """Test a developer asking a question against a documentation or code server."""
+        with patch.object(app.console, 'input', side_effect=user_inputs):
+            
+            # Setup realistic server mock
+            mock_client = patched_app.client
+            mock_client.get_connection_status.return_value.available_tools = available_tools
+            mock_client.list_tools.return_value = tools
             
             # Setup session with realistic conversation
-            mock_session = Mock()
-            mock_session.start_session = AsyncMock()
-            mock_session.end_session = AsyncMock()
+            mock_session = patched_app.session
+            patched_app.replay(events)
+            mock_session.get_session_info.return_value = _session_info(server_name, len(available_tools))
             
-            call_count = 0
-            async def mock_process_input(user_input):
-                nonlocal call_count
-                if call_count == 0:  # First call with the repository question
-                    for event in exploration_events:
-                        yield event
-                call_count += 1
-            
-            mock_session.process_input = mock_process_input
-            mock_session.get_session_info = Mock(return_value={
-                'active': True,
-                'server_name': 'github',
-                'model': 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
-                'tools_loaded': 4,
-                'mcp_connected': True,
-                'connection_status': {}
-            })
-            mock_session.mcp_client = mock_client
-            mock_session_class.return_value = mock_session
-            
-            mock_display = Mock()
-            mock_display_class.return_value = mock_display
+            mock_display = patched_app.display
             
             # Run the complete workflow
-            result = await app.run(temp_config_file, server_name='github')
+            result = await app.run(temp_config_file, server_name=server_name)
             
             # Verify the complete journey
             assert result == 0
@@ -248,56 +291,26 @@ class TestCompleteUserJourneys:
             mock_client.disconnect.assert_called_once()
             
             # Verify realistic interactions occurred
-            assert mock_display.stream_text_instant.call_count >= 3
-            assert mock_display.show_tool_usage.call_count == 2  # Two tool calls
-            assert mock_display.show_tool_result.call_count == 2
+            assert mock_display.stream_text_instant.call_count >= min_text_calls
+            assert mock_display.show_tool_usage.call_count == tool_calls
+            assert mock_display.show_tool_result.call_count == tool_calls
     
-    @pytest.mark.asyncio
-    async def test_server_selection_and_switching_workflow(self, temp_config_file):
+    async def test_server_selection_and_switching_workflow(self, app, patched_app, temp_config_file, monkeypatch):
         """Test user selecting from multiple servers and switching."""
-        app = CLIApp()
+        # Setup server selector to simulate user choice
+        mock_selector = Mock()
+        mock_selector.select_server = Mock(return_value='filesystem')
+        monkeypatch.setattr(eclaircp.ui, "ServerSelector", lambda *a, **k: mock_selector)
         
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.session.SessionManager') as mock_session_class, \
-             patch('eclaircp.ui.ServerSelector') as mock_selector_class, \
-             patch('eclaircp.ui.StreamingDisplay') as mock_display_class, \
-             patch('eclaircp.ui.StatusDisplay'), \
-             patch.object(app.console, 'input', side_effect=['/exit']):
-            
-            # Setup server selector to simulate user choice
-            mock_selector = Mock()
-            mock_selector.select_server = Mock(return_value='filesystem')
-            mock_selector_class.return_value = mock_selector
+        with patch.object(app.console, 'input', side_effect=['/exit']):
             
             # Setup filesystem server mock
-            mock_client = Mock()
-            mock_client.connect = AsyncMock(return_value=True)
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=True)
-            mock_client.get_connection_status = Mock()
-            mock_client.list_tools = AsyncMock(return_value=[
-                Mock(name='read_file', description='Read file contents'),
-                Mock(name='write_file', description='Write file contents'),
-                Mock(name='list_directory', description='List directory contents')
-            ])
-            mock_client_class.return_value = mock_client
+            mock_client = patched_app.client
+            mock_client.list_tools.return_value = FILESYSTEM_TOOLS
             
             # Setup session
-            mock_session = Mock()
-            mock_session.start_session = AsyncMock()
-            mock_session.end_session = AsyncMock()
-            mock_session.get_session_info = Mock(return_value={
-                'active': True,
-                'server_name': 'filesystem',
-                'model': 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
-                'tools_loaded': 3,
-                'mcp_connected': True,
-                'connection_status': {}
-            })
-            mock_session_class.return_value = mock_session
-            
-            mock_display = Mock()
-            mock_display_class.return_value = mock_display
+            mock_session = patched_app.session
+            mock_session.get_session_info.return_value = _session_info('filesystem', 3)
             
             # Run without specifying server (should trigger selection)
             result = await app.run(temp_config_file)
@@ -314,109 +327,60 @@ class TestCompleteUserJourneys:
 class TestErrorRecoveryScenarios:
     """Test error recovery in realistic scenarios."""
     
-    @pytest.mark.asyncio
-    async def test_connection_failure_and_retry(self, temp_config_file):
+    async def test_connection_failure_and_retry(self, app, patched_app):
         """Test handling connection failures with retry logic."""
-        app = CLIApp()
+        # Setup client that fails first, then succeeds
+        mock_client = patched_app.client
+        connection_attempts = 0
+        
+        async def mock_connect(config):
+            nonlocal connection_attempts
+            connection_attempts += 1
+            if connection_attempts < 2:
+                return False  # Fail first attempt
+            return True  # Succeed on second attempt
+        
+        mock_client.connect.side_effect = mock_connect
+        mock_client.is_connected.return_value = False
+        mock_client.get_connection_status.return_value.error_message = "Connection timeout"
+        
+        mock_status = patched_app.status
+        
+        # First attempt should fail
+        result1 = await app._handle_server_connection(
+            mock_client,
+            ECHO_SERVER_CONFIG,
+            mock_status
+        )
+        assert result1 is False
+        assert connection_attempts == 1
         
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.ui.StatusDisplay') as mock_status_class:
-            
-            # Setup client that fails first, then succeeds
-            mock_client = Mock()
-            connection_attempts = 0
-            
-            async def mock_connect(config):
-                nonlocal connection_attempts
-                connection_attempts += 1
-                if connection_attempts < 2:
-                    return False  # Fail first attempt
-                return True  # Succeed on second attempt
-            
-            mock_client.connect = mock_connect
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=False)
-            mock_client.get_connection_status = Mock()
-            mock_client.get_connection_status.return_value.error_message = "Connection timeout"
-            mock_client_class.return_value = mock_client
-            
-            mock_status = Mock()
-            mock_status_class.return_value = mock_status
-            
-            # First attempt should fail
-            result1 = await app._handle_server_connection(
-                mock_client,
-                MCPServerConfig(name='test', command='echo', args=['test']),
-                mock_status
-            )
-            assert result1 is False
-            assert connection_attempts == 1
-            
-            # Second attempt should succeed
-            mock_client.is_connected.return_value = True
-            mock_client.get_connection_status.return_value.error_message = None
-            mock_client.list_tools = AsyncMock(return_value=[])  # Add missing mock
-            
-            result2 = await app._handle_server_connection(
-                mock_client,
-                MCPServerConfig(name='test', command='echo', args=['test']),
-                mock_status
-            )
-            assert result2 is True
-            assert connection_attempts == 2
+        # Second attempt should succeed
+        mock_client.is_connected.return_value = True
+        mock_client.get_connection_status.return_value.error_message = None
+        
+        result2 = await app._handle_server_connection(
+            mock_client,
+            ECHO_SERVER_CONFIG,
+            mock_status
+        )
+        assert result2 is True
+        assert connection_attempts == 2
     
-    @pytest.mark.asyncio
-    async def test_session_error_recovery(self, temp_config_file):
+    async def test_session_error_recovery(self, app, patched_app, temp_config_file):
         """Test session error recovery scenarios."""
-        app = CLIApp()
-        
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.session.SessionManager') as mock_session_class, \
-             patch('eclaircp.ui.StreamingDisplay') as mock_display_class, \
-             patch('eclaircp.ui.StatusDisplay'), \
-             patch.object(app.console, 'input', side_effect=[
-                 'This should cause an error',
-                 '/exit'
-             ]):
-            
-            # Setup client
-            mock_client = Mock()
-            mock_client.connect = AsyncMock(return_value=True)
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=True)
-            mock_client.get_connection_status = Mock()
-            mock_client.list_tools = AsyncMock(return_value=[])
-            mock_client_class.return_value = mock_client
+        with patch.object(app.console, 'input', side_effect=[
+            'This should cause an error',
+            '/exit'
+        ]):
             
             # Setup session that fails on first input
-            mock_session = Mock()
-            mock_session.start_session = AsyncMock()
-            mock_session.end_session = AsyncMock()
+            mock_session = patched_app.session
             
-            call_count = 0
-            async def mock_process_input(user_input):
-                nonlocal call_count
-                if call_count == 0:
-                    # First call fails
-                    yield StreamEvent(
-                        event_type=StreamEventType.ERROR,
-                        data="Simulated processing error"
-                    )
-                call_count += 1
-            
-            mock_session.process_input = mock_process_input
-            mock_session.get_session_info = Mock(return_value={
-                'active': True,
-                'server_name': 'test-server',
-                'model': 'test-model',
-                'tools_loaded': 0,
-                'mcp_connected': True,
-                'connection_status': {}
-            })
-            mock_session_class.return_value = mock_session
-            
-            mock_display = Mock()
-            mock_display_class.return_value = mock_display
+            patched_app.replay(SESSION_ERROR_EVENTS)
+            mock_session.get_session_info.return_value = _session_info('test-server', 0, model='test-model')
+            
+            mock_display = patched_app.display
             
             # Run the workflow
             result = await app.run(temp_config_file, server_name='aws-docs')
@@ -427,11 +391,8 @@ class TestErrorRecoveryScenarios:
             # Verify error was displayed
             mock_display.show_error.assert_called_once_with("Simulated processing error")
     
-    @pytest.mark.asyncio
-    async def test_configuration_validation_errors(self):
+    async def test_configuration_validation_errors(self, app, tmp_path):
         """Test handling of configuration validation errors."""
-        app = CLIApp()
-        
         # Create invalid configuration
         invalid_config = {
             'servers': {
@@ -445,26 +406,19 @@ class TestErrorRecoveryScenarios:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(invalid_config, f)
-            temp_path = f.name
+        config_path = tmp_path / "invalid.yaml"
+        config_path.write_text(yaml.safe_dump(invalid_config))
         
-        try:
-            # Should handle validation errors gracefully
-            result = await app.run(temp_path)
-            assert result == 1  # Should fail with validation error
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        # Should handle validation errors gracefully
+        result = await app.run(str(config_path))
+        assert result == 1  # Should fail with validation error
 
 
 class TestLongRunningScenarios:
     """Test long-running usage scenarios."""
     
-    @pytest.mark.asyncio
-    async def test_extended_conversation_session(self, temp_config_file):
+    async def test_extended_conversation_session(self, app, patched_app, temp_config_file):
         """Test extended conversation with many interactions."""
-        app = CLIApp()
-        
         # Simulate a long conversation
         conversation_inputs = [
             'Tell me about AWS S3',
@@ -477,28 +431,14 @@ class TestLongRunningScenarios:
             '/exit'
         ]
         
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.session.SessionManager') as mock_session_class, \
-             patch('eclaircp.ui.StreamingDisplay') as mock_display_class, \
-             patch('eclaircp.ui.StatusDisplay'), \
-             patch.object(app.console, 'input', side_effect=conversation_inputs):
+        with patch.object(app.console, 'input', side_effect=conversation_inputs):
             
             # Setup client
-            mock_client = Mock()
-            mock_client.connect = AsyncMock(return_value=True)
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=True)
-            mock_client.get_connection_status = Mock()
-            mock_client.list_tools = AsyncMock(return_value=[
-                Mock(name='search_documentation', description='Search AWS docs'),
-                Mock(name='read_documentation', description='Read AWS docs')
-            ])
-            mock_client_class.return_value = mock_client
+            mock_client = patched_app.client
+            mock_client.list_tools.return_value = AWS_TOOLS[:2]
             
             # Setup session with responses to each input
-            mock_session = Mock()
-            mock_session.start_session = AsyncMock()
-            mock_session.end_session = AsyncMock()
+            mock_session = patched_app.session
             
             response_count = 0
             async def mock_process_input(user_input):
@@ -524,20 +464,10 @@ class TestLongRunningScenarios:
                 
                 yield StreamEvent(event_type=StreamEventType.COMPLETE, data="Response complete")
             
-            mock_session.process_input = mock_process_input
-            mock_session.get_session_info = Mock(return_value={
-                'active': True,
-                'server_name': 'aws-docs',
-                'model': 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
-                'tools_loaded': 2,
-                'mcp_connected': True,
-                'connection_status': {}
-            })
-            mock_session.mcp_client = mock_client
-            mock_session_class.return_value = mock_session
-            
-            mock_display = Mock()
-            mock_display_class.return_value = mock_display
+            mock_session.process_input.side_effect = mock_process_input
+            mock_session.get_session_info.return_value = _session_info('aws-docs', 2)
+            
+            mock_display = patched_app.display
             
             # Run the extended conversation
             result = await app.run(temp_config_file, server_name='aws-docs')
@@ -554,11 +484,8 @@ class TestLongRunningScenarios:
 class TestRealWorldIntegrationPatterns:
     """Test patterns that mirror real-world usage."""
     
-    @pytest.mark.asyncio
-    async def test_developer_workflow_documentation_research(self, temp_config_file):
+    async def test_developer_workflow_documentation_research(self, app, patched_app, temp_config_file):
         """Test a realistic developer workflow for documentation research."""
-        app = CLIApp()
-        
         # Realistic developer workflow: research -> read -> follow-up
         workflow_inputs = [
             'I need to understand how to implement AWS Lambda functions with S3 triggers',
@@ -567,84 +494,19 @@ class TestRealWorldIntegrationPatterns:
             '/exit'
         ]
         
-        # Realistic responses with tool usage
-        workflow_responses = [
-            [
-                StreamEvent(event_type=StreamEventType.TEXT, data="I'll help you research Lambda functions with S3 triggers."),
-                StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                    'tool_name': 'search_documentation',
-                    'arguments': {'search_phrase': 'Lambda S3 triggers'},
-                    'result': 'Found comprehensive documentation on Lambda S3 integration'
-                }),
-                StreamEvent(event_type=StreamEventType.TEXT, data=" Here's what I found about Lambda S3 triggers."),
-                StreamEvent(event_type=StreamEventType.COMPLETE, data="Search complete")
-            ],
-            [
-                StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                    'tool_name': 'read_documentation',
-                    'arguments': {'url': 'https://docs.aws.amazon.com/lambda/latest/dg/with-s3.html'},
-                    'result': 'Detailed documentation on configuring S3 event notifications for Lambda'
-                }),
-                StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the details on S3 event notifications."),
-                StreamEvent(event_type=StreamEventType.COMPLETE, data="Read complete")
-            ],
-            [
-                StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                    'tool_name': 'search_documentation',
-                    'arguments': {'search_phrase': 'Lambda S3 IAM permissions'},
-                    'result': 'Found IAM policy examples for Lambda S3 access'
-                }),
-                StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the required IAM permissions."),
-                StreamEvent(event_type=StreamEventType.COMPLETE, data="IAM search complete")
-            ]
-        ]
-        
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.session.SessionManager') as mock_session_class, \
-             patch('eclaircp.ui.StreamingDisplay') as mock_display_class, \
-             patch('eclaircp.ui.StatusDisplay'), \
-             patch.object(app.console, 'input', side_effect=workflow_inputs):
+        with patch.object(app.console, 'input', side_effect=workflow_inputs):
             
             # Setup AWS docs server
-            mock_client = Mock()
-            mock_client.connect = AsyncMock(return_value=True)
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=True)
-            mock_client.get_connection_status = Mock()
-            mock_client.list_tools = AsyncMock(return_value=[
-                Mock(name='search_documentation', description='Search AWS documentation'),
-                Mock(name='read_documentation', description='Read AWS documentation page'),
-                Mock(name='recommend', description='Get content recommendations')
-            ])
-            mock_client_class.return_value = mock_client
+            mock_client = patched_app.client
+            mock_client.list_tools.return_value = AWS_TOOLS
             
             # Setup session with realistic workflow responses
-            mock_session = Mock()
-            mock_session.start_session = AsyncMock()
-            mock_session.end_session = AsyncMock()
+            mock_session = patched_app.session
             
-            call_index = 0
-            async def mock_process_input(user_input):
-                nonlocal call_index
-                if call_index < len(workflow_responses):
-                    for event in workflow_responses[call_index]:
-                        yield event
-                    call_index += 1
-            
-            mock_session.process_input = mock_process_input
-            mock_session.get_session_info = Mock(return_value={
-                'active': True,
-                'server_name': 'aws-docs',
-                'model': 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
-                'tools_loaded': 3,
-                'mcp_connected': True,
-                'connection_status': {}
-            })
-            mock_session.mcp_client = mock_client
-            mock_session_class.return_value = mock_session
-            
-            mock_display = Mock()
-            mock_display_class.return_value = mock_display
+            patched_app.replay(*DOCS_RESEARCH_RESPONSES)
+            mock_session.get_session_info.return_value = _session_info('aws-docs', 3)
+            
+            mock_display = patched_app.display
             
             # Run the realistic workflow
             result = await app.run(temp_config_file, server_name='aws-docs')
@@ -657,11 +519,8 @@ class TestRealWorldIntegrationPatterns:
             assert mock_display.show_tool_result.call_count == 3
             assert mock_display.stream_text_instant.call_count >= 3  # Adjust expectation
     
-    @pytest.mark.asyncio
-    async def test_team_collaboration_scenario(self, temp_config_file):
+    async def test_team_collaboration_scenario(self, app, patched_app, temp_config_file):
         """Test scenario where team members use EclairCP for collaboration."""
-        app = CLIApp()
-        
         # Simulate team member exploring GitHub for project management
         team_workflow = [
             'Show me the open issues in our main repository',
@@ -670,101 +529,26 @@ class TestRealWorldIntegrationPatterns:
             '/exit'
         ]
         
-        github_responses = [
-            [
-                StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                    'tool_name': 'list_issues',
-                    'arguments': {'owner': 'team', 'repo': 'project', 'state': 'open'},
-                    'result': 'Found 12 open issues including 3 high priority bugs'
-                }),
-                StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the current open issues."),
-                StreamEvent(event_type=StreamEventType.COMPLETE, data="Issues listed")
-            ],
-            [
-                StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                    'tool_name': 'create_issue',
-                    'arguments': {
-                        'owner': 'team', 
-                        'repo': 'project',
-                        'title': 'Fix authentication bug',
-                        'body': 'Users report login failures after recent update'
-                    },
-                    'result': 'Created issue #47: Fix authentication bug'
-                }),
-                StreamEvent(event_type=StreamEventType.TEXT, data=" Created the new issue for the authentication bug."),
-                StreamEvent(event_type=StreamEventType.COMPLETE, data="Issue created")
-            ],
-            [
-                StreamEvent(event_type=StreamEventType.TOOL_USE, data={
-                    'tool_name': 'list_pull_requests',
-                    'arguments': {'owner': 'team', 'repo': 'project', 'state': 'open'},
-                    'result': 'Found 5 open pull requests awaiting review'
-                }),
-                StreamEvent(event_type=StreamEventType.TEXT, data=" Here are the pull requests needing review."),
-                StreamEvent(event_type=StreamEventType.COMPLETE, data="PRs listed")
-            ]
-        ]
-        
-        with patch('eclaircp.mcp.MCPClientManager') as mock_client_class, \
-             patch('eclaircp.session.SessionManager') as mock_session_class, \
-             patch('eclaircp.ui.StreamingDisplay') as mock_display_class, \
-             patch('eclaircp.ui.StatusDisplay'), \
-             patch.object(app.console, 'input', side_effect=team_workflow):
+        with patch.object(app.console, 'input', side_effect=team_workflow):
             
             # Setup GitHub server
-            mock_client = Mock()
-            mock_client.connect = AsyncMock(return_value=True)
-            mock_client.disconnect = AsyncMock()
-            mock_client.is_connected = Mock(return_value=True)
-            mock_client.get_connection_status = Mock()
-            mock_client.list_tools = AsyncMock(return_value=[
-                Mock(name='list_issues', description='List repository issues'),
-                Mock(name='create_issue', description='Create a new issue'),
-                Mock(name='list_pull_requests', description='List pull requests')
-            ])
-            mock_client_class.return_value = mock_client
+            mock_client = patched_app.client
+            mock_client.list_tools.return_value = GITHUB_PROJECT_TOOLS
             
             # Setup session
-            mock_session = Mock()
-            mock_session.start_session = AsyncMock()
-            mock_session.end_session = AsyncMock()
+            mock_session = patched_app.session
             
-            call_index = 0
-            async def mock_process_input(user_input):
-                nonlocal call_index
-                if call_index < len(github_responses):
-                    for event in github_responses[call_index]:
-                        yield event
-                    call_index += 1
-            
-            mock_session.process_input = mock_process_input
-            mock_session.get_session_info = Mock(return_value={
-                'active': True,
-                'server_name': 'github',
-                'model': 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
-                'tools_loaded': 3,
-                'mcp_connected': True,
-                'connection_status': {}
-            })
-            mock_session.mcp_client = mock_client
-            mock_session_class.return_value = mock_session
-            
-            mock_display = Mock()
-            mock_display_class.return_value = mock_display
+            patched_app.replay(*TEAM_WORKFLOW_RESPONSES)
+            mock_session.get_session_info.return_value = _session_info('github', 3)
+            
+            mock_display = patched_app.display
             
             # Run the team collaboration workflow
             result = await app.run(temp_config_file, server_name='github')
             
-            # Verify successful completion
-            assert result == 0
-            
-            # Verify team collaboration actions
-            assert mock_display.show_tool_usage.call_count == 3
-            assert mock_display.show_tool_result.call_count == 3
-            
-            # Verify specific GitHub operations were simulated
-            tool_calls = [call.args for call in mock_display.show_tool_usage.call_args_list]
-            tool_names = [call[0] for call in tool_calls]
-            assert 'list_issues' in tool_names
-            assert 'create_issue' in tool_names
-            assert 'list_pull_requests' in tool_names
\ No newline at end of file
+            # Verify successful completion and the GitHub operations, in order
+            assert (
+                result,
+                mock_display.show_tool_usage.mock_calls,
+                mock_display.show_tool_result.call_count,
+            ) == (0, TEAM_WORKFLOW_TOOL_CALLS, 3)
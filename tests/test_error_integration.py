@@ -2,8 +2,8 @@
 Integration tests for EclairCP error handling, display, and recovery.
 """
 
+import logging
 import pytest
-import tempfile
 import os
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
@@ -30,10 +30,109 @@ from eclaircp.error_logging import (
     log_info,
     log_warning,
 )
-from eclaircp.ui import StreamingDisplay
+from eclaircp.ui import StatusDisplay, StreamingDisplay
 from rich.console import Console
 
 
+DISPLAY_CASES = [
+    pytest.param(ConfigurationError("test"), "⚙️", "Configuration Error", id="configuration"),
+    pytest.param(ConnectionError("test"), "🔌", "Connection Error", id="connection"),
+    pytest.param(SessionError("test"), "💬", "Session Error", id="session"),
+    pytest.param(ToolExecutionError("test"), "🛠️", "Tool Execution Error", id="tool-execution"),
+    pytest.param(ValidationError("test"), "✅", "Validation Error", id="validation"),
+    pytest.param(UserInterruptError("test"), "⏹️", "Operation Cancelled", id="user-interrupt"),
+    pytest.param(EclairCPError("test"), "❌", "Error", id="base"),
+]
+
+RECOVERY_CASES = [
+    pytest.param(ConfigurationError("test"), "Edit configuration file", id="configuration"),
+    pytest.param(ConnectionError("test"), "Retry connection", id="connection"),
+    pytest.param(SessionError("test"), "Restart session", id="session"),
+    pytest.param(ToolExecutionError("test"), "Retry tool execution", id="tool-execution"),
+    pytest.param(ValidationError("test"), "Correct the input", id="validation"),
+    pytest.param(EclairCPError("test"), "Retry operation", id="base"),
+]
+
+LOG_OUTPUT_EXPECTED = (
+    "Config test error",
+    "Connection test error",
+    "Session test error",
+    "Test info message",
+    "Test debug message",
+    "eclaircp",
+)
+
+SCENARIOS = [
+    pytest.param(
+        create_configuration_error,
+        "Configuration file not found: /test/config.yaml",
+        {
+            "config_path": "/test/config.yaml",
+            "original_error": FileNotFoundError("No such file or directory"),
+        },
+        "log_configuration_error",
+        {"config_path": "/test/config.yaml"},
+        "1",  # Choose first option
+        "Edit configuration file",
+        ["Configuration Error", "/test/config.yaml", "Original Error", "FileNotFoundError"],
+        id="configuration",
+    ),
+    pytest.param(
+        create_connection_error,
+        "Connection to test-server timed out after 30 seconds",
+        {"server_name": "test-server", "server_command": "uvx test-server", "timeout": 30},
+        "log_connection_error",
+        {"server_name": "test-server", "server_command": "uvx test-server", "connection_attempt": 2},
+        "2",  # Choose second option
+        "Select different server",
+        ["Connection Error", "test-server", "30"],
+        id="connection",
+    ),
+    pytest.param(
+        create_session_error,
+        "Failed to initialize agent with specified model",
+        {"session_id": "sess_123", "agent_model": "claude-3-sonnet"},
+        "log_session_error",
+        {"session_id": "sess_123", "agent_model": "claude-3-sonnet", "message_count": 0},
+        "2",  # Choose second option
+        "Change agent model",
+        ["Session Error", "sess_123", "claude-3-sonnet"],
+        id="session",
+    ),
+]
+
+
+def _raise_keyboard_interrupt(*args, **kwargs):
+    """Stand-in for a prompt that the user cancels with Ctrl+C."""
+    raise KeyboardInterrupt
+
+
+class ListHandler(logging.Handler):
+    """Logging handler that keeps emitted records in memory."""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture(scope="class")
+def recording_console():
+    """Plain-text recording console, built once per test class."""
+    return Console(
+        file=StringIO(), width=80, record=True,
+        force_terminal=False, no_color=True, highlight=False
+    )
+
+
+@pytest.fixture(scope="module")
+def lookup_display():
+    """Display used only for error-type lookups, which never write output."""
+    return StreamingDisplay(console=Console(file=StringIO(), width=80))
+
+
 class TestErrorLogging:
     """Test error logging functionality."""
     
@@ -44,24 +143,19 @@ class TestErrorLogging:
         assert logger.logger.name == "eclaircp"
         assert logger.logger.level == 20  # INFO level
     
-    def test_logger_with_file(self):
+    def test_logger_with_file(self, tmp_path):
         """Test logger with file output."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            log_file = f.name
+        log_file = str(tmp_path / "test.log")
         
-        try:
-            logger = EclairCPLogger(log_file=log_file, log_level="DEBUG")
-            logger.log_info("Test message")
-            
-            # Check that log file was created and contains the message
-            assert os.path.exists(log_file)
-            with open(log_file, 'r') as f:
-                content = f.read()
-                assert "Test message" in content
-                assert "eclaircp" in content
-        finally:
-            if os.path.exists(log_file):
-                os.unlink(log_file)
+        logger = EclairCPLogger(log_file=log_file, log_level="DEBUG")
+        logger.log_info("Test message")
+        
+        # Check that log file was created and contains the message
+        assert os.path.exists(log_file)
+        with open(log_file, 'r') as f:
+            content = f.read()
+            assert "Test message" in content
+            assert "eclaircp" in content
     
     def test_log_eclaircp_error(self):
         """Test logging EclairCP errors with context."""
@@ -159,11 +253,11 @@ class TestErrorLogging:
 class TestErrorDisplay:
     """Test error display functionality in UI."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Create a console that captures output
-        self.output = StringIO()
-        self.console = Console(file=self.output, width=80)
+    @pytest.fixture(autouse=True)
+    def _bind_display(self, recording_console):
+        """Bind the shared console, with its recording cleared, to a fresh display."""
+        self.console = recording_console
+        self.console.export_text(clear=True)
         self.display = StreamingDisplay(console=self.console)
     
     def test_show_eclaircp_error_basic(self):
@@ -171,7 +265,7 @@ class TestErrorDisplay:
         error = ConfigurationError("Test configuration error")
         
         self.display.show_eclaircp_error(error)
-        output = self.output.getvalue()
+        output = self.console.export_text()
         
         assert "Configuration Error" in output
         assert "Test configuration error" in output
@@ -187,7 +281,7 @@ class TestErrorDisplay:
         error.add_context("retry_count", 3)
         
         self.display.show_eclaircp_error(error)
-        output = self.output.getvalue()
+        output = self.console.export_text()
         
         assert "Connection Error" in output
         assert "Connection failed" in output
@@ -203,7 +297,7 @@ class TestErrorDisplay:
         error.add_suggestion("Refer to the documentation")
         
         self.display.show_eclaircp_error(error)
-        output = self.output.getvalue()
+        output = self.console.export_text()
         
         assert "Validation Error" in output
         assert "Invalid input" in output
@@ -220,13 +314,58 @@ class TestErrorDisplay:
         )
         
         self.display.show_eclaircp_error(error)
-        output = self.output.getvalue()
+        output = self.console.export_text()
         
         assert "Configuration Error" in output
         assert "Configuration validation failed" in output
         assert "Original Error" in output
         assert "ValueError: Original validation error" in output
-    
+
+    def test_show_original_error_repeated(self):
+        """Test repeated display of the same original error reuses rendered text."""
+        original = ValueError("Original validation error")
+        error = create_configuration_error(
+            "Configuration validation failed",
+            original_error=original
+        )
+
+        with patch.object(self.display.console, 'render_str', wraps=self.display.console.render_str) as mock_render:
+            self.display.show_eclaircp_error(error)
+            self.display.show_eclaircp_error(error)
+
+        original_renders = [
+            c for c in mock_render.call_args_list if "ValueError" in str(c.args[0])
+        ]
+        assert len(original_renders) == 1
+        assert self.console.export_text().count("ValueError: Original validation error") == 2
+
+    def test_show_original_error_keeps_only_last(self):
+        """Test that showing a different original error replaces the cached one."""
+        first = ValueError("First failure")
+        second = OSError("Second failure")
+
+        with patch.object(self.console, 'render_str', wraps=self.console.render_str) as mock_render:
+            self.display._show_original_error(first)
+            self.display._show_original_error(second)
+            self.display._show_original_error(first)
+
+        assert mock_render.call_count == 3
+        output = self.console.export_text()
+        assert output.count("ValueError: First failure") == 2
+        assert output.count("OSError: Second failure") == 1
+
+    def test_status_display_show_original_error_repeated(self):
+        """Test that StatusDisplay reuses rendered text for the same original error."""
+        status = StatusDisplay(console=self.console)
+        original = ValueError("Original validation error")
+
+        with patch.object(self.console, 'render_str', wraps=self.console.render_str) as mock_render:
+            status._show_original_error(original)
+            status._show_original_error(original)
+
+        assert mock_render.call_count == 1
+        assert self.console.export_text().count("ValueError: Original validation error") == 2
+
     def test_show_error_with_recovery_no_options(self):
         """Test error display with recovery when no options provided."""
         error = SessionError("Session failed")
@@ -235,7 +374,7 @@ class TestErrorDisplay:
             result = self.display.show_error_with_recovery(error)
             
         assert result is None
-        output = self.output.getvalue()
+        output = self.console.export_text()
         assert "Session Error" in output
         assert "Recovery Options" in output
         assert "Restart session" in output  # Default recovery option
@@ -250,7 +389,7 @@ class TestErrorDisplay:
             result = self.display.show_error_with_recovery(error, recovery_options)
             
         assert result == "Retry with different args"
-        output = self.output.getvalue()
+        output = self.console.export_text()
         assert "Tool Execution Error" in output
         assert "Recovery Options" in output
         assert "Retry with different args" in output
@@ -260,150 +399,79 @@ class TestErrorDisplay:
         """Test error recovery when user cancels."""
         error = ConnectionError("Connection failed")
         
-        with patch('rich.prompt.Prompt.ask', side_effect=KeyboardInterrupt):
+        with patch('rich.prompt.Prompt.ask', new=_raise_keyboard_interrupt):
             result = self.display.show_error_with_recovery(error)
             
         assert result is None
-        output = self.output.getvalue()
+        output = self.console.export_text()
         assert "Operation cancelled" in output
+
+
+class TestErrorDisplayLookups:
+    """Test per-error-type display lookups that do not render output."""
     
-    def test_error_display_info_for_different_types(self):
+    @pytest.mark.parametrize("error,expected_icon,expected_title", DISPLAY_CASES)
+    def test_error_display_info_for_different_types(self, lookup_display, error, expected_icon, expected_title):
         """Test that different error types get appropriate display info."""
-        test_cases = [
-            (ConfigurationError("test"), "⚙️", "Configuration Error"),
-            (ConnectionError("test"), "🔌", "Connection Error"),
-            (SessionError("test"), "💬", "Session Error"),
-            (ToolExecutionError("test"), "🛠️", "Tool Execution Error"),
-            (ValidationError("test"), "✅", "Validation Error"),
-            (UserInterruptError("test"), "⏹️", "Operation Cancelled"),
-            (EclairCPError("test"), "❌", "Error"),  # Base error
-        ]
-        
-        for error, expected_icon, expected_title in test_cases:
-            info = self.display._get_error_display_info(error)
-            assert info["icon"] == expected_icon
-            assert info["title"] == expected_title
+        info = lookup_display._get_error_display_info(error)
+        assert info["icon"] == expected_icon
+        assert info["title"] == expected_title
     
-    def test_default_recovery_options(self):
+    @pytest.mark.parametrize("error,expected_option", RECOVERY_CASES)
+    def test_default_recovery_options(self, lookup_display, error, expected_option):
         """Test default recovery options for different error types."""
-        test_cases = [
-            (ConfigurationError("test"), "Edit configuration file"),
-            (ConnectionError("test"), "Retry connection"),
-            (SessionError("test"), "Restart session"),
-            (ToolExecutionError("test"), "Retry tool execution"),
-            (ValidationError("test"), "Correct the input"),
-            (EclairCPError("test"), "Retry operation"),  # Base error
-        ]
-        
-        for error, expected_option in test_cases:
-            options = self.display._get_default_recovery_options(error)
-            assert len(options) > 0
-            assert expected_option in options
+        options = lookup_display._get_default_recovery_options(error)
+        assert len(options) > 0
+        assert expected_option in options
 
 
 class TestErrorIntegrationScenarios:
     """Test complete error handling scenarios."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.output = StringIO()
-        self.console = Console(file=self.output, width=80)
+    @pytest.fixture(autouse=True)
+    def _bind_display(self, recording_console):
+        """Bind the shared console, with its recording cleared, to a fresh display.
+
+        The logger's stderr handler is swapped for a record-capturing one so
+        scenarios print nothing; the original handlers are restored on
+        teardown.
+        """
+        self.console = recording_console
+        self.console.export_text(clear=True)
         self.display = StreamingDisplay(console=self.console)
         self.logger = EclairCPLogger()
+        self.log_records = ListHandler()
+        console_handlers = list(self.logger.logger.handlers)
+        for handler in console_handlers:
+            self.logger.logger.removeHandler(handler)
+        self.logger.logger.addHandler(self.log_records)
+        yield
+        self.logger.logger.removeHandler(self.log_records)
+        for handler in console_handlers:
+            self.logger.logger.addHandler(handler)
     
-    def test_configuration_error_scenario(self):
-        """Test complete configuration error handling scenario."""
-        # Simulate a configuration file error
-        config_path = "/test/config.yaml"
-        original_error = FileNotFoundError("No such file or directory")
-        
-        error = create_configuration_error(
-            f"Configuration file not found: {config_path}",
-            config_path=config_path,
-            original_error=original_error
-        )
-        
-        # Log the error
-        with patch.object(self.logger.logger, 'error') as mock_log:
-            self.logger.log_configuration_error(error, config_path=config_path)
-            mock_log.assert_called_once()
-        
-        # Display the error with recovery
-        with patch('rich.prompt.Prompt.ask', return_value='1'):  # Choose first option
-            recovery_choice = self.display.show_error_with_recovery(error)
-        
-        assert recovery_choice == "Edit configuration file"
-        output = self.output.getvalue()
-        assert "Configuration Error" in output
-        assert config_path in output
-        assert "Original Error" in output
-        assert "FileNotFoundError" in output
-    
-    def test_connection_error_scenario(self):
-        """Test complete connection error handling scenario."""
-        # Simulate a connection timeout error
-        server_name = "test-server"
-        server_command = "uvx test-server"
-        timeout = 30
-        
-        error = create_connection_error(
-            f"Connection to {server_name} timed out after {timeout} seconds",
-            server_name=server_name,
-            server_command=server_command,
-            timeout=timeout
-        )
+    @pytest.mark.parametrize(
+        "factory,message,error_kwargs,log_method,log_kwargs,choice,expected_recovery,expected_output",
+        SCENARIOS,
+    )
+    def test_error_scenario(self, factory, message, error_kwargs, log_method, log_kwargs,
+                            choice, expected_recovery, expected_output):
+        """Test complete error handling scenario: create, log, then display with recovery."""
+        error = factory(message, **error_kwargs)
         
         # Log the error
-        with patch.object(self.logger.logger, 'error') as mock_log:
-            self.logger.log_connection_error(
-                error,
-                server_name=server_name,
-                server_command=server_command,
-                connection_attempt=2
-            )
-            mock_log.assert_called_once()
+        getattr(self.logger, log_method)(error, **log_kwargs)
+        assert [record.levelno for record in self.log_records.records] == [logging.ERROR]
+        assert message in self.log_records.records[0].getMessage()
         
         # Display the error with recovery
-        with patch('rich.prompt.Prompt.ask', return_value='2'):  # Choose second option
+        with patch('rich.prompt.Prompt.ask', return_value=choice):
             recovery_choice = self.display.show_error_with_recovery(error)
         
-        assert recovery_choice == "Select different server"
-        output = self.output.getvalue()
-        assert "Connection Error" in output
-        assert server_name in output
-        assert str(timeout) in output
-    
-    def test_session_error_scenario(self):
-        """Test complete session error handling scenario."""
-        # Simulate a session initialization error
-        session_id = "sess_123"
-        agent_model = "claude-3-sonnet"
-        
-        error = create_session_error(
-            "Failed to initialize agent with specified model",
-            session_id=session_id,
-            agent_model=agent_model
-        )
-        
-        # Log the error
-        with patch.object(self.logger.logger, 'error') as mock_log:
-            self.logger.log_session_error(
-                error,
-                session_id=session_id,
-                agent_model=agent_model,
-                message_count=0
-            )
-            mock_log.assert_called_once()
-        
-        # Display the error with recovery
-        with patch('rich.prompt.Prompt.ask', return_value='2'):  # Choose second option
-            recovery_choice = self.display.show_error_with_recovery(error)
-        
-        assert recovery_choice == "Change agent model"
-        output = self.output.getvalue()
-        assert "Session Error" in output
-        assert session_id in output
-        assert agent_model in output
+        assert recovery_choice == expected_recovery
+        output = self.console.export_text()
+        for text in expected_output:
+            assert text in output
     
     def test_error_chaining_and_context_preservation(self):
         """Test that error context and chaining is preserved through the system."""
@@ -432,48 +500,44 @@ class TestErrorIntegrationScenarios:
         
         # Test that display shows all information
         self.display.show_eclaircp_error(config_error)
-        output = self.output.getvalue()
+        output = self.console.export_text()
         
-        assert "Configuration Error" in output
-        assert "Failed to parse configuration file" in output
-        assert "Context" in output
-        assert "/test/config.yaml" in output
-        assert "servers" in output
-        assert "15" in output
-        assert "Original Error" in output
-        assert "ValueError: Invalid YAML syntax at line 15" in output
+        expected = {
+            "Configuration Error",
+            "Failed to parse configuration file",
+            "Context",
+            "/test/config.yaml",
+            "servers",
+            "15",
+            "Original Error",
+            "ValueError: Invalid YAML syntax at line 15",
+        }
+        missing = {text for text in expected if text not in output}
+        assert not missing, f"Missing from output: {missing}"
     
-    def test_logging_integration_with_file_output(self):
-        """Test that logging works correctly with file output."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.log') as f:
-            log_file = f.name
-        
+    def test_logging_integration_output(self):
+        """Test that logging works correctly across error types and levels."""
+        # Set up logger, then capture its formatted output in memory
+        logger = setup_logging(log_level="DEBUG")
+        stream = StringIO()
+        capture = logging.StreamHandler(stream)
+        capture.setFormatter(logger.logger.handlers[0].formatter)
+        logger.logger.addHandler(capture)
         try:
-            # Set up logger with file output
-            logger = setup_logging(log_file=log_file, log_level="DEBUG")
-            
             # Create and log various types of errors
             config_error = ConfigurationError("Config test error")
             connection_error = ConnectionError("Connection test error")
             session_error = SessionError("Session test error")
-            
+
             logger.log_error(config_error)
             logger.log_error(connection_error)
             logger.log_error(session_error)
             logger.log_info("Test info message")
             logger.log_debug("Test debug message")
-            
-            # Verify log file contents
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-            
-            assert "Config test error" in log_content
-            assert "Connection test error" in log_content
-            assert "Session test error" in log_content
-            assert "Test info message" in log_content
-            assert "Test debug message" in log_content
-            assert "eclaircp" in log_content
-            
+
+            # Verify captured log contents
+            log_content = stream.getvalue()
+            missing = [text for text in LOG_OUTPUT_EXPECTED if text not in log_content]
+            assert not missing, f"Missing from log output: {missing}"
         finally:
-            if os.path.exists(log_file):
-                os.unlink(log_file)
\ No newline at end of file
+            logger.logger.removeHandler(capture)
@@ -76,21 +76,8 @@ class TestMCPClientManager:
         assert not mcp_manager.is_connected()
     
     @pytest.mark.asyncio
-    @patch('eclaircp.mcp.stdio_client')
-    async def test_connect_success(self, mock_stdio_client, mcp_manager, sample_config):
+    async def test_connect_success(self, mock_mcp_stack, mcp_manager, sample_config):
         """Test successful connection to MCP server."""
-        # Mock the stdio client context manager
-        mock_read = Mock()
-        mock_write = Mock()
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = (mock_read, mock_write)
-        mock_context.__aexit__.return_value = None
-        mock_stdio_client.return_value = mock_context
-        
-        # Mock the client session
-        mock_session = AsyncMock()
-        mock_session.initialize = AsyncMock()
-        
         # Mock tools response
         mock_tool = Mock()
         mock_tool.name = "test_tool"
@@ -100,63 +87,41 @@ class TestMCPClientManager:
         
         mock_tools_response = Mock()
         mock_tools_response.tools = [mock_tool]
-        mock_session.list_tools.return_value = mock_tools_response
+        mock_mcp_stack.list_tools.return_value = mock_tools_response
         
-        with patch('eclaircp.mcp.ClientSession', return_value=mock_session):
-            result = await mcp_manager.connect(sample_config)
-            
-            assert result is True
-            assert mcp_manager.is_connected()
-            assert mcp_manager._connected_server == sample_config
-            
-            status = mcp_manager.get_connection_status()
-            assert status.connected
-            assert status.server_name == "test-server"
-            assert status.connection_time is not None
-            assert status.available_tools == ["test_tool"]
-            assert len(mcp_manager._available_tools) == 1
-            assert mcp_manager._available_tools[0].name == "test_tool"
+        result = await mcp_manager.connect(sample_config)
+        
+        assert result is True
+        assert mcp_manager.is_connected()
+        assert mcp_manager._connected_server == sample_config
+        
+        status = mcp_manager.get_connection_status()
+        assert status.connected
+        assert status.server_name == "test-server"
+        assert status.connection_time is not None
+        assert status.available_tools == ["test_tool"]
+        assert len(mcp_manager._available_tools) == 1
+        assert mcp_manager._available_tools[0].name == "test_tool"
     
     @pytest.mark.asyncio
-    @patch('eclaircp.mcp.stdio_client')
-    async def test_connect_timeout(self, mock_stdio_client, mcp_manager, sample_config):
+    async def test_connect_timeout(self, mock_mcp_stack, mcp_manager, sample_config):
         """Test connection timeout handling."""
-        # Mock the stdio client context manager
-        mock_read = Mock()
-        mock_write = Mock()
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = (mock_read, mock_write)
-        mock_context.__aexit__.return_value = None
-        mock_stdio_client.return_value = mock_context
-        
         # Mock the client session with timeout
-        mock_session = AsyncMock()
-        mock_session.initialize.side_effect = asyncio.TimeoutError()
+        mock_mcp_stack.initialize.side_effect = asyncio.TimeoutError()
         
-        with patch('eclaircp.mcp.ClientSession', return_value=mock_session):
-            with pytest.raises(ConnectionError, match="Connection timeout after 10 seconds"):
-                await mcp_manager.connect(sample_config)
-            
-            assert not mcp_manager.is_connected()
-            status = mcp_manager.get_connection_status()
-            assert not status.connected
-            assert "Connection timeout" in status.error_message
+        with pytest.raises(ConnectionError, match="Connection timeout after 10 seconds"):
+            await mcp_manager.connect(sample_config)
+        
+        assert not mcp_manager.is_connected()
+        status = mcp_manager.get_connection_status()
+        assert not status.connected
+        assert "Connection timeout" in status.error_message
     
     @pytest.mark.asyncio
-    @patch('eclaircp.mcp.stdio_client')
-    async def test_connect_retry_logic(self, mock_stdio_client, mcp_manager, sample_config):
+    async def test_connect_retry_logic(self, mock_mcp_stack, mcp_manager, sample_config):
         """Test connection retry logic with eventual success."""
-        # Mock the stdio client context manager
-        mock_read = Mock()
-        mock_write = Mock()
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = (mock_read, mock_write)
-        mock_context.__aexit__.return_value = None
-        mock_stdio_client.return_value = mock_context
-        
         # Mock the client session - fail first attempt, succeed second
-        mock_session = AsyncMock()
-        mock_session.initialize.side_effect = [
+        mock_mcp_stack.initialize.side_effect = [
             Exception("First attempt fails"),
             None  # Second attempt succeeds
         ]
@@ -169,42 +134,30 @@ class TestMCPClientManager:
         
         mock_tools_response = Mock()
         mock_tools_response.tools = [mock_tool]
-        mock_session.list_tools.return_value = mock_tools_response
-        
-        with patch('eclaircp.mcp.ClientSession', return_value=mock_session):
-            with patch('asyncio.sleep'):  # Speed up the test
-                result = await mcp_manager.connect(sample_config)
-                
-                assert result is True
-                assert mcp_manager.is_connected()
-                # Verify initialize was called twice (retry logic)
-                assert mock_session.initialize.call_count == 2
+        mock_mcp_stack.list_tools.return_value = mock_tools_response
+        
+        with patch('asyncio.sleep'):  # Speed up the test
+            result = await mcp_manager.connect(sample_config)
+            
+            assert result is True
+            assert mcp_manager.is_connected()
+            # Verify initialize was called twice (retry logic)
+            assert mock_mcp_stack.initialize.call_count == 2
     
     @pytest.mark.asyncio
-    @patch('eclaircp.mcp.stdio_client')
-    async def test_connect_all_retries_fail(self, mock_stdio_client, mcp_manager, sample_config):
+    async def test_connect_all_retries_fail(self, mock_mcp_stack, mcp_manager, sample_config):
         """Test connection failure after all retries."""
-        # Mock the stdio client context manager
-        mock_read = Mock()
-        mock_write = Mock()
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = (mock_read, mock_write)
-        mock_context.__aexit__.return_value = None
-        mock_stdio_client.return_value = mock_context
-        
         # Mock the client session to always fail
-        mock_session = AsyncMock()
-        mock_session.initialize.side_effect = Exception("Connection failed")
-        
-        with patch('eclaircp.mcp.ClientSession', return_value=mock_session):
-            with patch('asyncio.sleep'):  # Speed up the test
-                with pytest.raises(ConnectionError, match="Failed to connect to test-server after 2 attempts"):
-                    await mcp_manager.connect(sample_config)
-                
-                assert not mcp_manager.is_connected()
-                status = mcp_manager.get_connection_status()
-                assert not status.connected
-                assert "Connection failed" in status.error_message
+        mock_mcp_stack.initialize.side_effect = Exception("Connection failed")
+        
+        with patch('asyncio.sleep'):  # Speed up the test
+            with pytest.raises(ConnectionError, match="Failed to connect to test-server after 2 attempts"):
+                await mcp_manager.connect(sample_config)
+            
+            assert not mcp_manager.is_connected()
+            status = mcp_manager.get_connection_status()
+            assert not status.connected
+            assert "Connection failed" in status.error_message
     
     @pytest.mark.asyncio
     async def test_disconnect_cleanup(self, mcp_manager):
@@ -450,7 +403,7 @@ class TestMCPIntegration:
     """Integration tests for MCP client functionality."""
     
     @pytest.mark.asyncio
-    async def test_full_workflow_mock(self):
+    async def test_full_workflow_mock(self, mock_mcp_stack):
         """Test the complete workflow from connection to tool execution."""
         # Create a manager and config
         manager = MCPClientManager()
@@ -462,70 +415,55 @@ class TestMCPIntegration:
             retry_attempts=1
         )
         
-        # Mock the entire MCP client workflow
-        with patch('eclaircp.mcp.stdio_client') as mock_stdio_client:
-            # Mock stdio client context manager
-            mock_read = Mock()
-            mock_write = Mock()
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value = (mock_read, mock_write)
-            mock_context.__aexit__.return_value = None
-            mock_stdio_client.return_value = mock_context
+        # Mock tool definition
+        mock_tool = Mock()
+        mock_tool.name = "search"
+        mock_tool.description = "Search for information"
+        mock_tool.inputSchema = Mock()
+        mock_tool.inputSchema.model_dump.return_value = {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"}
+            },
+            "required": ["query"]
+        }
+        
+        mock_tools_response = Mock()
+        mock_tools_response.tools = [mock_tool]
+        mock_mcp_stack.list_tools.return_value = mock_tools_response
+        
+        # Mock tool execution
+        mock_mcp_stack.call_tool.return_value = Mock(
+            model_dump=lambda: {"content": [{"text": "Search results"}]}
+        )
+        
+        with patch('strands.tool') as mock_tool_decorator:
+            mock_tool_decorator.side_effect = lambda f: f
             
-            # Mock client session
-            mock_session = AsyncMock()
-            mock_session.initialize = AsyncMock()
+            # Test the complete workflow
+            # 1. Connect to server
+            success = await manager.connect(config)
+            assert success
+            assert manager.is_connected()
             
-            # Mock tool definition
-            mock_tool = Mock()
-            mock_tool.name = "search"
-            mock_tool.description = "Search for information"
-            mock_tool.inputSchema = Mock()
-            mock_tool.inputSchema.model_dump.return_value = {
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query"}
-                },
-                "required": ["query"]
-            }
+            # 2. List available tools
+            tools = await manager.list_tools()
+            assert len(tools) == 1
+            assert tools[0].name == "search"
             
-            mock_tools_response = Mock()
-            mock_tools_response.tools = [mock_tool]
-            mock_session.list_tools.return_value = mock_tools_response
+            # 3. Get Strands-compatible tools
+            strands_tools = manager.get_strands_tools()
+            assert len(strands_tools) == 1
+            assert callable(strands_tools[0])
             
-            # Mock tool execution
-            mock_session.call_tool.return_value = Mock(
-                model_dump=lambda: {"content": [{"text": "Search results"}]}
-            )
+            # 4. Execute a tool
+            result = await manager.call_tool("search", {"query": "test"})
+            assert result["content"][0]["text"] == "Search results"
+            
+            # 5. Execute via Strands wrapper
+            wrapped_result = await strands_tools[0](query="test")
+            assert wrapped_result == "Search results"
             
-            with patch('eclaircp.mcp.ClientSession', return_value=mock_session):
-                with patch('strands.tool') as mock_tool_decorator:
-                    mock_tool_decorator.side_effect = lambda f: f
-                    
-                    # Test the complete workflow
-                    # 1. Connect to server
-                    success = await manager.connect(config)
-                    assert success
-                    assert manager.is_connected()
-                    
-                    # 2. List available tools
-                    tools = await manager.list_tools()
-                    assert len(tools) == 1
-                    assert tools[0].name == "search"
-                    
-                    # 3. Get Strands-compatible tools
-                    strands_tools = manager.get_strands_tools()
-                    assert len(strands_tools) == 1
-                    assert callable(strands_tools[0])
-                    
-                    # 4. Execute a tool
-                    result = await manager.call_tool("search", {"query": "test"})
-                    assert result["content"][0]["text"] == "Search results"
-                    
-                    # 5. Execute via Strands wrapper
-                    wrapped_result = await strands_tools[0](query="test")
-                    assert wrapped_result == "Search results"
-                    
-                    # 6. Disconnect
-                    await manager.disconnect()
-                    assert not manager.is_connected()
\ No newline at end of file
+            # 6. Disconnect
+            await manager.disconnect()
+            assert not manager.is_connected()
\ No newline at end of file